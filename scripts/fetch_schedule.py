@@ -4,18 +4,35 @@ Scrapes gregbellmedia.com for the weekly SiriusXM Channel 148 schedule,
 parses the Excel file, and outputs JSON for the website.
 """
 
+import hashlib
 import json
 import logging
+import posixpath
 import re
 import sys
-from datetime import datetime, timedelta, timezone
-from io import BytesIO
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from openpyxl import load_workbook
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+from openpyxl.utils.exceptions import CellCoordinatesException
+from requests.adapters import HTTPAdapter
+
+# orjson is optional: it writes the same two-space JSON much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -27,17 +44,64 @@ logger = logging.getLogger(__name__)
 # Constants
 SCHEDULE_SOURCE_URL = "https://gregbellmedia.com/"
 OUTPUT_PATH = Path(__file__).parent.parent / "docs" / "schedule.json"
+# HTTP cache validators (ETag / Last-Modified) of the Excel file behind schedule.json
+META_PATH = Path(__file__).parent.parent / "docs" / "schedule.meta.json"
+# Bump whenever parsing changes, so schedule.json is rebuilt from an unchanged workbook
+PARSER_VERSION = 1
+# Downloads larger than this spill from memory to a temporary file
+EXCEL_SPOOL_SIZE = 16 * 1024 * 1024
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# Filename date range: MonthDay(st/nd/rd/th)Year-MonthDay(st/nd/rd/th)Year
+# (matched against lowercased text, so no IGNORECASE)
+FILENAME_DATE_PATTERN = re.compile(
+    r'([a-z]{3})(\d{1,2})(?:st|nd|rd|th)?(\d{4})-'
+    r'([a-z]{3})(\d{1,2})(?:st|nd|rd|th)?(\d{4})'
+)
+
+# Text date range: "Jan 19th - Jan 25th, 2026" or "January 19 - January 25, 2026"
+# (matched against lowercased text, so no IGNORECASE)
+TEXT_DATE_PATTERN = re.compile(
+    r'([a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*[-–]\s*'
+    r'([a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})'
+)
+
+# Month names and abbreviations, as used in filenames and the sheet title
+MONTHS = {
+    'jan': 1, 'january': 1,
+    'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4,
+    'may': 5,
+    'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12
+}
+
+# Numeric dates: "1/19/2026", "1-19-26"
+NUMERIC_DATE_PATTERN = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})')
+
+# An air date anywhere in a show cell, e.g. "Suspense 1/2/45"
+AIR_DATE_PATTERN = re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}')
+
+# ET column times: "2am", "10 pm"
+ET_TIME_PATTERN = re.compile(r'(\d{1,2})\s*(am|pm)')
+
+# Shared HTTP session so the page fetch and the Excel download (same host)
+# reuse one keep-alive connection instead of two TCP+TLS handshakes
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 
 def fetch_page(url: str) -> Optional[str]:
     """Fetch HTML content from a URL."""
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=30
-        )
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.RequestException as e:
@@ -54,28 +118,16 @@ def parse_date_from_filename(filename: str) -> Optional[tuple[datetime, datetime
 
     Returns: (start_date, end_date) as datetime objects, or None if parsing fails.
     """
-    MONTHS = {
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-    }
-
-    # Pattern: MonthDay(st/nd/rd/th)Year-MonthDay(st/nd/rd/th)Year
-    pattern = re.compile(
-        r'([A-Za-z]{3})(\d{1,2})(?:st|nd|rd|th)?(\d{4})-'
-        r'([A-Za-z]{3})(\d{1,2})(?:st|nd|rd|th)?(\d{4})',
-        re.IGNORECASE
-    )
-
-    match = pattern.search(filename)
+    match = FILENAME_DATE_PATTERN.search(filename.lower())
     if not match:
         return None
 
     try:
-        start_month = MONTHS.get(match.group(1).lower())
+        start_month = MONTHS.get(match.group(1))
         start_day = int(match.group(2))
         start_year = int(match.group(3))
 
-        end_month = MONTHS.get(match.group(4).lower())
+        end_month = MONTHS.get(match.group(4))
         end_day = int(match.group(5))
         end_year = int(match.group(6))
 
@@ -90,77 +142,97 @@ def parse_date_from_filename(filename: str) -> Optional[tuple[datetime, datetime
         return None
 
 
-def find_excel_url(html: str) -> Optional[str]:
-    """Extract the Excel schedule URL for the current week from the page HTML.
+def is_excel_link(href: str) -> bool:
+    """Check whether a link points at a Radio Classics Excel file.
 
-    Finds all Excel files, parses their date ranges, and selects the one
-    that contains today's date. Falls back to the most recent if current
-    week is not found.
+    Matches e.g. RC_Jan12th2026-Jan18th2026-Excel-Version.xlsx: 'RC_', then
+    'Excel', then '.xlsx', in that order and in any case.
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    today = datetime.now()
+    href_lower = href.lower()
+    start = href_lower.find('rc_')
+    if start < 0:
+        return False
+    start = href_lower.find('excel', start + 3)
+    return start >= 0 and href_lower.find('.xlsx', start + 5) >= 0
 
-    # Pattern for Radio Classics Excel files
-    excel_pattern = re.compile(r'RC_.*Excel.*\.xlsx', re.IGNORECASE)
 
-    # Collect all Excel URLs with their date ranges
+def find_excel_url(html: str) -> Optional[str]:
+    """Extract the Excel schedule URL for the current week from the page HTML.
+
+    Scans the Excel links in a single pass, parsing their date ranges, and
+    returns the first one that contains today's date. Falls back to the most
+    recent if current week is not found.
+    """
+    # Only the href strings are needed, so skip building a BeautifulSoup tree
+    try:
+        doc = lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        doc = lxml_html.fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        # Empty document
+        doc = None
+    hrefs = doc.xpath('//a/@href') if doc is not None else []
+    today = date.today()
+
+    # Collect all Excel URLs with their date ranges, remembering the first
+    # plain .xlsx link as a fallback so the links are only walked once
     excel_files = []
+    fallback_url = None
+
+    for href in hrefs:
+        href = str(href)
+        # Handle protocol-relative URLs
+        if href.startswith('//'):
+            href = 'https:' + href
+
+        if not is_excel_link(href):
+            if fallback_url is None and href.endswith('.xlsx'):
+                fallback_url = href
+            continue
+
+        # Try to parse dates from filename
+        date_range = parse_date_from_filename(href)
+        if date_range:
+            start_date, end_date = date_range
+            logger.debug(f"Found Excel: {href} ({start_date.date()} to {end_date.date()})")
+
+            # The first file containing today's date wins, no need to look further
+            if start_date.date() <= today <= end_date.date():
+                logger.info(f"Selected Excel for current week: {href}")
+                logger.info(f"  Date range: {start_date.date()} to {end_date.date()}")
+                return href
 
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-        if excel_pattern.search(href):
-            # Handle protocol-relative URLs
-            if href.startswith('//'):
-                href = 'https:' + href
-
-            # Try to parse dates from filename
-            date_range = parse_date_from_filename(href)
-            if date_range:
-                start_date, end_date = date_range
-                excel_files.append({
-                    'url': href,
-                    'start': start_date,
-                    'end': end_date
-                })
-                logger.debug(f"Found Excel: {href} ({start_date.date()} to {end_date.date()})")
-            else:
-                # Include files without parseable dates as fallback
-                excel_files.append({
-                    'url': href,
-                    'start': None,
-                    'end': None
-                })
-                logger.debug(f"Found Excel (no date): {href}")
+            excel_files.append({
+                'url': href,
+                'start': start_date,
+                'end': end_date
+            })
+        else:
+            # Include files without parseable dates as fallback
+            excel_files.append({
+                'url': href,
+                'start': None,
+                'end': None
+            })
+            logger.debug(f"Found Excel (no date): {href}")
 
     if not excel_files:
-        # Fallback: look for any .xlsx files
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if href.endswith('.xlsx'):
-                if href.startswith('//'):
-                    href = 'https:' + href
-                logger.info(f"Found Excel URL (fallback): {href}")
-                return href
+        # Fallback: any .xlsx file
+        if fallback_url:
+            logger.info(f"Found Excel URL (fallback): {fallback_url}")
+            return fallback_url
 
         logger.error("No Excel file URL found on the page")
         return None
 
-    logger.info(f"Found {len(excel_files)} Excel files on the page")
-
-    # First pass: find file containing today's date
-    for excel in excel_files:
-        if excel['start'] and excel['end']:
-            if excel['start'].date() <= today.date() <= excel['end'].date():
-                logger.info(f"Selected Excel for current week: {excel['url']}")
-                logger.info(f"  Date range: {excel['start'].date()} to {excel['end'].date()}")
-                return excel['url']
+    logger.info(f"Found {len(excel_files)} Excel files on the page, none for the current week")
 
-    # Second pass: find the most recent file (by end date)
+    # Otherwise use the most recent file (by end date)
     dated_files = [f for f in excel_files if f['start'] is not None]
     if dated_files:
-        # Sort by end date descending
-        dated_files.sort(key=lambda x: x['end'], reverse=True)
-        best = dated_files[0]
+        # Latest end date; ties keep the first listed, as a stable sort would
+        best = max(dated_files, key=itemgetter('end'))
         logger.warning(f"Current week not found, using most recent: {best['url']}")
         logger.warning(f"  Date range: {best['start'].date()} to {best['end'].date()}")
         return best['url']
@@ -170,51 +242,125 @@ def find_excel_url(html: str) -> Optional[str]:
     return excel_files[0]['url']
 
 
-def download_excel(url: str) -> Optional[BytesIO]:
-    """Download Excel file and return as BytesIO."""
+def download_excel(url: str, validators: Optional[dict] = None) -> tuple[Optional[BinaryIO], Optional[dict]]:
+    """Download Excel file and return it as a file object along with its cache validators.
+
+    If validators from an earlier download of the same URL are given, the
+    request is made conditional (If-None-Match / If-Modified-Since).
+
+    Returns:
+    - (excel_data, new_validators) on a full download
+    - (None, validators) if the server answered 304 Not Modified
+    - (None, None) if the download failed
+
+    The body is streamed straight into a spooled temporary file, so the
+    workbook is held in memory once and spills to disk if it is unusually
+    large. The caller should close it when done. The new validators also
+    carry a SHA-256 of the body, to spot re-served copies of the same file.
+    """
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=60
-        )
-        response.raise_for_status()
-        logger.info(f"Downloaded Excel file ({len(response.content)} bytes)")
-        return BytesIO(response.content)
+        with SESSION.get(url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 304:
+                logger.info("Excel file not modified since last download")
+                return None, validators
+
+            response.raise_for_status()
+            excel_data = SpooledTemporaryFile(max_size=EXCEL_SPOOL_SIZE)
+            digest = hashlib.sha256()
+            for chunk in response.iter_content(chunk_size=65536):
+                excel_data.write(chunk)
+                digest.update(chunk)
+            new_validators = {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'sha256': digest.hexdigest()
+            }
+        logger.info(f"Downloaded Excel file ({excel_data.tell()} bytes)")
+        excel_data.seek(0)
+        return excel_data, new_validators
     except requests.RequestException as e:
         logger.error(f"Failed to download Excel file: {e}")
+        return None, None
+
+
+def load_excel_validators(url: str, meta_path: Path, schedule_path: Path) -> Optional[dict]:
+    """Load the saved cache validators for url.
+
+    Only returns them if the schedule on disk was successfully built from
+    that same URL by this version of the parser, so a 304 never preserves a
+    placeholder/error schedule or one produced by an older parser.
+    """
+    try:
+        validators = json.loads(meta_path.read_text(encoding='utf-8'))
+        schedule = json.loads(schedule_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
         return None
 
+    if (validators.pop('parser_version', None) != PARSER_VERSION
+            or validators.get('url') != url or 'error' in schedule):
+        return None
+    return validators
+
+
+def save_excel_validators(validators: dict, meta_path: Path) -> bool:
+    """Save the cache validators of the downloaded Excel file, tagged with the parser version."""
+    try:
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({**validators, 'parser_version': PARSER_VERSION}, f, indent=2)
+        return True
+    except IOError as e:
+        logger.error(f"Failed to save cache validators: {e}")
+        return False
+
+
+# 12-hour clock label and AM/PM for each hour of the day (0-23)
+DISPLAY_HOURS = tuple((hour - 1) % 12 + 1 for hour in range(24))
+PERIODS = tuple("AM" if hour < 12 else "PM" for hour in range(24))
+
 
+@lru_cache(maxsize=256)
 def format_time_et(hour: int, minute: int) -> str:
     """Format hour (0-23) and minute as '12:00 AM' style string."""
-    if hour == 0:
-        display_hour = 12
-        period = "AM"
-    elif hour < 12:
-        display_hour = hour
-        period = "AM"
-    elif hour == 12:
-        display_hour = 12
-        period = "PM"
-    else:
-        display_hour = hour - 12
-        period = "PM"
+    return f"{DISPLAY_HOURS[hour]}:{minute:02d} {PERIODS[hour]}"
+
 
-    return f"{display_hour}:{minute:02d} {period}"
+# Usual ET column labels ('12mid', '1am' ... '11am', '12noon', '1pm' ... '11pm')
+ET_TIME_LABELS = {
+    '12mid': 0, '12midnight': 0, 'midnight': 0, '12am': 0,
+    '12noon': 12, 'noon': 12, '12pm': 12,
+    **{f'{hour}am': hour for hour in range(1, 12)},
+    **{f'{hour}pm': hour + 12 for hour in range(1, 12)},
+}
 
 
-def parse_time_value_to_hour(time_val: str) -> Optional[int]:
+def parse_time_value_to_hour(time_val) -> Optional[int]:
     """Parse a time value from the ET column into a 24-hour value.
 
-    Handles formats like: '12mid', '2am', '4am', '12noon', '2pm', '10pm'
+    Handles formats like: '12mid', '2am', '4am', '12noon', '2pm', '10pm',
+    as well as native Excel time cells (read as time/datetime).
     Returns the hour (0-23) or None if not recognized.
     """
     if not time_val:
         return None
 
+    if isinstance(time_val, (datetime, time)):
+        return time_val.hour
+
     time_str = str(time_val).lower().strip()
 
+    # The ET column uses a small fixed set of labels
+    hour = ET_TIME_LABELS.get(time_str)
+    if hour is not None:
+        return hour
+
     # Handle special cases
     if 'mid' in time_str or time_str == '12am':
         return 0
@@ -222,7 +368,7 @@ def parse_time_value_to_hour(time_val: str) -> Optional[int]:
         return 12
 
     # Pattern: number followed by am/pm
-    match = re.match(r'(\d{1,2})\s*(am|pm)', time_str)
+    match = ET_TIME_PATTERN.match(time_str)
     if match:
         hour = int(match.group(1))
         period = match.group(2)
@@ -235,51 +381,72 @@ def parse_time_value_to_hour(time_val: str) -> Optional[int]:
 
 
 # Words that indicate a cell is a continuation of the previous cell
-CONTINUATION_WORDS = ['from ', 'with ', 'starring ', 'featuring ', 'hosted by ', 'and ']
+# (tuples so str.startswith can test them all in one call)
+CONTINUATION_WORDS = ('from ', 'with ', 'starring ', 'featuring ', 'hosted by ', 'and ')
+
+# Leading articles that mark the start of a new show title
+ARTICLES = ('the ', 'a ', 'an ')
 
 # Known 60-minute shows (partial matches)
 HOUR_SHOWS = ['lux radio', 'screen director', 'theatre guild', 'screen guild']
 
+# Explicit duration markers in the data
+HOUR_MARKER_PATTERN = re.compile(r'\(1 hr\)|\(60 min\)|\(1 hour\)')
+HALF_HOUR_MARKER_PATTERN = re.compile(r'\(1/2 hr\)|\(30 min\)')
 
-def get_block_for_row(row: int, time_blocks: list[tuple[int, int]],
-                      rows_per_block: int) -> int:
-    """Get the block index for a given row number."""
-    for i, (block_start, _) in enumerate(time_blocks):
-        block_end = block_start + rows_per_block
-        if block_start <= row < block_end:
-            return i
-    return -1
+# Hour-long programming: "Two From X", "Two X Episodes", "Two 1/2 Hour" (2 x 30 min)
+# and the known 60-minute shows
+HOUR_SHOW_PATTERN = re.compile(
+    r'^two from |two episodes|two 1/2 hour|' + '|'.join(map(re.escape, HOUR_SHOWS))
+)
 
+# Day names to look for in the header row, with their display form
+DAY_NAMES = [(day, day.capitalize()) for day in
+             ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']]
+DAY_LOOKUP = dict(DAY_NAMES)
 
-def is_continuation(text: str, prev_text: str, row: int, prev_row: int,
-                    time_blocks: list[tuple[int, int]], rows_per_block: int) -> bool:
-    """Determine if text is a continuation of the previous cell.
+# Sheet dimensions can include many empty trailing columns; the header and
+# ET columns are always near the left edge
+MAX_HEADER_COLUMNS = 50
 
-    Returns True if the text should be joined with the previous cell.
+
+def build_block_index(time_blocks: list[tuple[int, int]],
+                      rows_per_block: int) -> dict[int, int]:
+    """Map each row number to the index of the time block containing it.
+
+    Blocks are filled last to first so that, if spacing is inconsistent and
+    blocks overlap, a row belongs to the earliest block that contains it.
+
+    Returns:
+        Dict of row number -> block index (rows outside every block are absent)
     """
-    if not text or not prev_text:
-        return False
+    block_index = {}
+    for i in range(len(time_blocks) - 1, -1, -1):
+        block_start = time_blocks[i][0]
+        for row in range(block_start, block_start + rows_per_block):
+            block_index[row] = i
+    return block_index
 
-    # Never join across time block boundaries
-    if get_block_for_row(row, time_blocks, rows_per_block) != \
-       get_block_for_row(prev_row, time_blocks, rows_per_block):
-        return False
 
-    text_lower = text.lower().strip()
-    has_date = bool(re.search(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', text))
+def is_continuation(text: str, text_lower: str, has_date: bool,
+                    prev_has_date: bool) -> bool:
+    """Determine if text is a continuation of the previous cell.
+
+    The caller is responsible for never joining across time block boundaries;
+    text_lower and the date flags are computed once per cell.
 
+    Returns True if the text should be joined with the previous cell.
+    """
     # Starts with continuation words = definitely continuation
-    for word in CONTINUATION_WORDS:
-        if text_lower.startswith(word):
-            return True
+    if text_lower.startswith(CONTINUATION_WORDS):
+        return True
 
     # Lowercase start WITHOUT a date = continuation
-    if text and text[0].islower() and not has_date:
+    if text[0].islower() and not has_date:
         return True
 
     # Two consecutive cells without dates (excluding articles) = continuation
-    if not has_date and not any(text_lower.startswith(x) for x in ['the ', 'a ', 'an ']):
-        prev_has_date = bool(re.search(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', prev_text))
+    if not has_date and not text_lower.startswith(ARTICLES):
         if not prev_has_date:
             # Check if prev_text looks like a show name that continues
             # Avoid joining unrelated shows - only join if no year pattern in prev
@@ -288,116 +455,423 @@ def is_continuation(text: str, prev_text: str, row: int, prev_row: int,
     return False
 
 
-def estimate_show_duration(show_name: str) -> int:
+def estimate_show_duration(show_lower: str) -> int:
     """Estimate show duration in minutes based on name patterns.
 
     Old-time radio shows were typically 15, 30, or 60 minutes.
+    Expects the already-lowercased show name.
     Returns duration in minutes.
     """
-    show_lower = show_name.lower()
-
     # Theme headers don't consume time (they're descriptive)
     if show_lower.startswith('[theme]'):
         return 0
 
-    # Explicit duration markers in the data
-    if '(1 hr)' in show_lower or '(60 min)' in show_lower or '(1 hour)' in show_lower:
+    # Explicit duration markers in the data take precedence
+    if HOUR_MARKER_PATTERN.search(show_lower):
         return 60
-    if '(1/2 hr)' in show_lower or '(30 min)' in show_lower:
+    if HALF_HOUR_MARKER_PATTERN.search(show_lower):
         return 30
     if '(15 min)' in show_lower:
         return 15
 
-    # "Two From X" or "Two X Episodes" = 2 episodes x 30 min
-    if show_lower.startswith('two from ') or 'two episodes' in show_lower:
-        return 60
-
-    # "Two 1/2 Hour" pattern = 2 x 30 min
-    if 'two 1/2 hour' in show_lower:
-        return 60
-
-    # Known 60-minute shows
-    if any(show in show_lower for show in HOUR_SHOWS):
+    # Double episodes and known 60-minute shows
+    if HOUR_SHOW_PATTERN.search(show_lower):
         return 60
 
     # Default to 30 minutes (most common for Golden Age radio)
     return 30
 
 
-def is_theme_header(show_name: str, is_bold: bool) -> bool:
+# Keywords that mark a bold, undated cell as a theme header
+THEME_KEYWORDS = ('birthday', 'marathon', 'when radio was', 'tribute',
+                  'anniversary', 'salute', 'celebration', 'memorial')
+
+
+def is_theme_header(show_lower: str, is_bold: bool, has_date: bool) -> bool:
     """Check if this is a theme header (birthday, marathon, etc.).
 
     Theme headers are bold cells without dates that indicate themed programming.
+    Expects the already-lowercased show name.
     """
-    has_date = bool(re.search(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', show_name))
     if is_bold and not has_date:
-        lower = show_name.lower()
-        theme_keywords = ['birthday', 'marathon', 'when radio was', 'tribute',
-                         'anniversary', 'salute', 'celebration', 'memorial']
-        if any(kw in lower for kw in theme_keywords):
+        if any(kw in show_lower for kw in THEME_KEYWORDS):
             return True
     return False
 
 
-def find_header_row(ws, max_rows: int = 20) -> Optional[tuple[int, dict]]:
-    """Find the header row containing day names and return column mapping.
+def cell_value(rows: list[tuple], row: int, col: int):
+    """Get a cell value from a row grid by 1-based row/column, or None if out of range."""
+    if 0 < row <= len(rows):
+        values = rows[row - 1]
+        if 0 < col <= len(values):
+            return values[col - 1]
+    return None
 
-    Returns: (row_number, {col_index: day_name}) or None if not found.
+
+def detect_time_blocks(rows: list[tuple], et_column: int, start_row: int,
+                       max_rows: int = 100) -> list[tuple[int, int]]:
+    """Detect time blocks by reading the ET column.
+
+    Returns list of (row_number, hour_24h) for each time block start.
     """
-    day_names = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    time_blocks = []
+    # Rows past the end of the grid are empty, so don't walk them
+    end_row = min(start_row + max_rows, len(rows) + 1)
+
+    for row_idx in range(start_row, end_row):
+        # Once the block spacing is known, a run of more than two blocks'
+        # worth of unlabeled rows means the schedule has ended
+        if len(time_blocks) >= 2:
+            spacing = time_blocks[1][0] - time_blocks[0][0]
+            if row_idx - time_blocks[-1][0] > 2 * spacing:
+                break
+
+        cell_val = cell_value(rows, row_idx, et_column)
+        if cell_val:
+            hour = parse_time_value_to_hour(cell_val)
+            if hour is not None:
+                time_blocks.append((row_idx, hour))
+                logger.debug(f"Found time block at row {row_idx}: {cell_val} -> {hour}:00")
+
+    return time_blocks
+
+
+def scan_worksheet(rows: list[tuple], max_rows: int = 20) -> Optional[tuple[int, dict, Optional[int], list]]:
+    """Locate the schedule layout in the value grid.
 
-    for row_idx in range(1, max_rows + 1):
+    Finds the header row (the first with at least 5 day names) and the ET
+    column in the same pass over the top rows, then reads the time blocks
+    down the ET column.
+
+    Returns: (header_row, {col_index: day_name}, et_column, time_blocks),
+    or None if no header row is found. et_column is None (and time_blocks
+    empty) if the header has no ET column.
+    """
+    for row_idx, row in enumerate(rows[:max_rows], start=1):
         day_columns = {}
+        # Distinct days seen; a repeated day label must not end the scan early
+        days_found = set()
+        et_column = None
 
-        for col_idx in range(1, ws.max_column + 1):
-            cell_val = ws.cell(row=row_idx, column=col_idx).value
-            if cell_val:
-                cell_str = str(cell_val).lower().strip()
-                for day in day_names:
-                    if day in cell_str:
-                        # Capitalize properly for output
-                        day_columns[col_idx] = day.capitalize()
-                        break
+        for col_idx, cell_val in enumerate(row[:MAX_HEADER_COLUMNS], start=1):
+            # Day names and the ET label are always text cells
+            if not cell_val or not isinstance(cell_val, str):
+                continue
+            cell_str = cell_val.lower().strip()
+
+            if len(days_found) < len(DAY_NAMES):
+                # Header cells are usually just the day name; only search
+                # for one inside longer text when that misses
+                display_name = DAY_LOOKUP.get(cell_str)
+                if not display_name:
+                    for day, name in DAY_NAMES:
+                        if day in cell_str:
+                            display_name = name
+                            break
+                if display_name:
+                    day_columns[col_idx] = display_name
+                    days_found.add(display_name)
+
+            if et_column is None and (cell_str == 'et' or 'eastern' in cell_str):
+                et_column = col_idx
+
+            if len(days_found) == len(DAY_NAMES) and et_column is not None:
+                break
 
         # Need at least 5 days to consider this the header row
         if len(day_columns) >= 5:
             logger.info(f"Found header row at row {row_idx} with {len(day_columns)} days")
-            return row_idx, day_columns
+            time_blocks = []
+            if et_column:
+                logger.info(f"Found ET column at column {et_column}")
+                time_blocks = detect_time_blocks(rows, et_column, row_idx + 1)
+            return row_idx, day_columns, et_column, time_blocks
 
     return None
 
 
-def find_et_column(ws, header_row: int) -> Optional[int]:
-    """Find the Eastern Time (ET) column in the header row."""
-    for col_idx in range(1, ws.max_column + 1):
-        cell_val = ws.cell(row=header_row, column=col_idx).value
-        if cell_val:
-            cell_str = str(cell_val).upper().strip()
-            if cell_str == 'ET' or 'EASTERN' in cell_str:
-                logger.info(f"Found ET column at column {col_idx}")
-                return col_idx
-    return None
+# SpreadsheetML namespaces, for reading xlsx parts directly
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
 
 
-def detect_time_blocks(ws, et_column: int, start_row: int, max_rows: int = 100) -> list[tuple[int, int]]:
-    """Detect time blocks by reading the ET column.
+def xlsx_text(node) -> str:
+    """Get the plain text of a shared/inline string node (ignoring phonetic runs)."""
+    snippets = [node.findtext(f'{SHEET_NS}t') or '']
+    for run in node.iterfind(f'{SHEET_NS}r'):
+        snippets.append(run.findtext(f'{SHEET_NS}t') or '')
+    return ''.join(snippets)
 
-    Returns list of (row_number, hour_24h) for each time block start.
-    """
-    time_blocks = []
 
-    for row_idx in range(start_row, start_row + max_rows):
-        cell_val = ws.cell(row=row_idx, column=et_column).value
-        if cell_val:
-            hour = parse_time_value_to_hour(cell_val)
-            if hour is not None:
-                time_blocks.append((row_idx, hour))
-                logger.debug(f"Found time block at row {row_idx}: {cell_val} -> {hour}:00")
+def read_xlsx_direct(excel_data: BinaryIO) -> tuple[list[tuple], set[tuple[int, int]]]:
+    """Read the active sheet straight from the xlsx zip, bypassing openpyxl's object model.
 
-    return time_blocks
+    Stream-parses the shared strings, styles and sheet XML with ElementTree and
+    converts values the same way openpyxl does with data_only=True.
 
+    Returns: (list of row value tuples, set of (row, col) positions of bold cells)
+    Raises ValueError, KeyError, IndexError, AttributeError, OverflowError,
+    zipfile.BadZipFile, ET.ParseError or CellCoordinatesException if the file
+    does not have the expected layout.
+    """
+    with zipfile.ZipFile(excel_data) as archive:
+        workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+        if workbook.tag != f'{SHEET_NS}workbook':
+            raise ValueError(f"Unsupported workbook format: {workbook.tag}")
+
+        # Map relationship ids to (type, part path)
+        parts = {}
+        for rel in ET.fromstring(archive.read('xl/_rels/workbook.xml.rels')):
+            target = rel.get('Target')
+            if target.startswith('/'):
+                path = target.lstrip('/')
+            else:
+                path = posixpath.normpath(posixpath.join('xl', target))
+            parts[rel.get('Id')] = (rel.get('Type').rsplit('/', 1)[-1], path)
+
+        # Active sheet, as openpyxl's wb.active would pick it
+        view = workbook.find(f'{SHEET_NS}bookViews/{SHEET_NS}workbookView')
+        active = int(view.get('activeTab', 0)) if view is not None else 0
+        sheet = workbook.findall(f'{SHEET_NS}sheets/{SHEET_NS}sheet')[active]
+        part_type, sheet_path = parts[sheet.get(f'{REL_NS}id')]
+        if part_type != 'worksheet':
+            raise ValueError(f"Active sheet is a {part_type}, not a worksheet")
+
+        properties = workbook.find(f'{SHEET_NS}workbookPr')
+        date1904 = properties is not None and properties.get('date1904') in ('1', 'true')
+        epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        shared_strings = []
+        bold_styles = []
+        date_styles = set()
+        timedelta_styles = set()
+        for part_type, path in parts.values():
+            if part_type == 'sharedStrings':
+                with archive.open(path) as f:
+                    for _, node in ET.iterparse(f):
+                        if node.tag == f'{SHEET_NS}si':
+                            shared_strings.append(xlsx_text(node).replace('x005F_', ''))
+                            node.clear()
+            elif part_type == 'styles':
+                styles = ET.fromstring(archive.read(path))
+                bold_fonts = []
+                for font in styles.iterfind(f'{SHEET_NS}fonts/{SHEET_NS}font'):
+                    bold = font.find(f'{SHEET_NS}b')
+                    bold_fonts.append(bold is not None and
+                                      bold.get('val', 'true').lower() not in ('0', 'false'))
+                custom_formats = {
+                    int(num_fmt.get('numFmtId')): num_fmt.get('formatCode')
+                    for num_fmt in styles.iterfind(f'{SHEET_NS}numFmts/{SHEET_NS}numFmt')
+                }
+                for style_id, xf in enumerate(styles.iterfind(f'{SHEET_NS}cellXfs/{SHEET_NS}xf')):
+                    font_id = int(xf.get('fontId', 0))
+                    bold_styles.append(font_id < len(bold_fonts) and bold_fonts[font_id])
+                    num_fmt_id = int(xf.get('numFmtId', 0))
+                    fmt = custom_formats.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+                    if is_date_format(fmt):
+                        date_styles.add(style_id)
+                    if is_timedelta_format(fmt):
+                        timedelta_styles.add(style_id)
+
+        rows = []
+        bold_cells = set()
+        with archive.open(sheet_path) as f:
+            for _, node in ET.iterparse(f):
+                if node.tag != f'{SHEET_NS}row':
+                    continue
+
+                row_idx = int(node.get('r', len(rows) + 1))
+                if row_idx <= len(rows):
+                    raise ValueError(f"Row {row_idx} is out of order")
+                rows.extend([()] * (row_idx - 1 - len(rows)))
+
+                values = []
+                for cell in node.iterfind(f'{SHEET_NS}c'):
+                    ref = cell.get('r')
+                    col_idx = coordinate_to_tuple(ref)[1] if ref else len(values) + 1
+                    if col_idx <= len(values):
+                        raise ValueError(f"Cell {ref} is out of order")
+                    values.extend([None] * (col_idx - 1 - len(values)))
+
+                    data_type = cell.get('t', 'n')
+                    style_id = int(cell.get('s', 0))
+                    if data_type == 'inlineStr':
+                        inline = cell.find(f'{SHEET_NS}is')
+                        value = xlsx_text(inline) if inline is not None else None
+                    else:
+                        value = cell.findtext(f'{SHEET_NS}v') or None
+                        if value is None:
+                            pass
+                        elif data_type == 'n':
+                            if '.' in value or 'E' in value or 'e' in value:
+                                value = float(value)
+                            else:
+                                value = int(value)
+                            if style_id in date_styles:
+                                # Out-of-range serials become an error value, as in openpyxl
+                                try:
+                                    value = from_excel(value, epoch,
+                                                       timedelta=style_id in timedelta_styles)
+                                except (OverflowError, ValueError):
+                                    value = '#VALUE!'
+                        elif data_type == 's':
+                            value = shared_strings[int(value)]
+                        elif data_type == 'b':
+                            value = bool(int(value))
+                        elif data_type == 'd':
+                            value = from_ISO8601(value)
+                        # 'str' (formula result) and 'e' (error) keep their text
+
+                    values.append(value)
+                    if value is not None and style_id < len(bold_styles) and bold_styles[style_id]:
+                        bold_cells.add((row_idx, col_idx))
+
+                rows.append(tuple(values))
+                node.clear()
+
+    return rows, bold_cells
+
+
+def read_xlsx_openpyxl(excel_data: BinaryIO) -> tuple[list[tuple], set[tuple[int, int]]]:
+    """Read the active sheet with openpyxl (fallback for read_xlsx_direct).
+
+    Returns: (list of row value tuples, set of (row, col) positions of bold cells)
+    """
+    # A single read-only pass: read-only cells still carry their style, so the
+    # bold flags come from the same stream as the values
+    wb = load_workbook(excel_data, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        # Read every row in the sheet; a wrong <dimension> tag would otherwise
+        # cut the grid short
+        ws.reset_dimensions()
+        rows = []
+        bold_cells = set()
+        for row_idx, row in enumerate(ws.iter_rows(), start=1):
+            rows.append(tuple(cell.value for cell in row))
+            for col_idx, cell in enumerate(row, start=1):
+                if cell.value is not None and cell.font and cell.font.bold:
+                    bold_cells.add((row_idx, col_idx))
+    finally:
+        wb.close()
+
+    return rows, bold_cells
+
+
+# Cell text that stands for an empty slot
+PLACEHOLDER_VALUES = frozenset({'none', 'n/a', '-'})
+
+
+def parse_day_column(rows: list[tuple], bold_cells: set[tuple[int, int]],
+                     col_idx: int, day_name: str,
+                     time_blocks: list[tuple[int, int]], rows_per_block: int,
+                     block_index: dict[int, int]) -> list[tuple[int, dict]]:
+    """Collect, join and time the shows in one day column.
+
+    Returns:
+        List of (sort_minutes, slot) pairs in block order
+    """
+    # Collect all cells for this day as parallel lists indexed by cell
+    values = []
+    lowers = []
+    has_dates = []
+    bolds = []
+    cell_rows = []
+    cell_blocks = []
+    block_idxs = []
+    base_hours = []
+
+    for block_idx, (block_start_row, base_hour) in enumerate(time_blocks):
+        # Slice the block's rows out of the grid once (rows are 1-based)
+        block_rows = rows[block_start_row - 1:block_start_row - 1 + rows_per_block]
+        for row_num, row in enumerate(block_rows, start=block_start_row):
+            value = row[col_idx - 1] if col_idx <= len(row) else None
+            if not value:
+                continue
 
-def parse_excel_schedule(excel_data: BytesIO) -> dict:
+            # Text cells are already str; only coerce numbers/dates
+            val = value.strip() if isinstance(value, str) else str(value).strip()
+            val_lower = val.lower()
+            if val and val_lower not in PLACEHOLDER_VALUES:
+                values.append(val)
+                lowers.append(val_lower)
+                has_dates.append(bool(AIR_DATE_PATTERN.search(val)))
+                bolds.append((row_num, col_idx) in bold_cells)
+                cell_rows.append(row_num)
+                cell_blocks.append(block_index.get(row_num, -1))
+                block_idxs.append(block_idx)
+                base_hours.append(base_hour)
+
+    # Join continuations for this day
+    joined_shows = []
+    num_cells = len(values)
+    i = 0
+
+    while i < num_cells:
+        # Look ahead for continuations within the same time block
+        j = i + 1
+        while (j < num_cells and cell_blocks[j] == cell_blocks[j-1]
+               and is_continuation(values[j], lowers[j], has_dates[j], has_dates[j-1])):
+            j += 1
+
+        # Build the joined show name; dates never span the joining space,
+        # so the joined text has a date exactly when one of its parts does
+        show_name = ' '.join(values[i:j])
+        show_lower = ' '.join(lowers[i:j])
+
+        # Check if this is a theme header
+        if is_theme_header(show_lower, bolds[i], any(has_dates[i:j])):
+            show_name = f"[THEME] {show_name}"
+            show_lower = f"[theme] {show_lower}"
+
+        joined_shows.append({
+            'show': show_name,
+            'lower': show_lower,
+            'block_idx': block_idxs[i],
+            'base_hour': base_hours[i],
+            'start_row': cell_rows[i]
+        })
+
+        i = j
+
+    # Calculate times based on show durations within each block
+    # Group shows by block
+    blocks = {}
+    for show in joined_shows:
+        block_idx = show['block_idx']
+        if block_idx not in blocks:
+            blocks[block_idx] = []
+        blocks[block_idx].append(show)
+
+    # Process each block and assign times as (sort_minutes, slot) pairs
+    day_slots = []
+    for block_idx, block_shows in blocks.items():
+        if not block_shows:
+            continue
+
+        base_hour = block_shows[0]['base_hour']
+        current_minutes = base_hour * 60
+
+        for show in block_shows:
+            hour = (current_minutes // 60) % 24
+            minute = current_minutes % 60
+            time_str = format_time_et(hour, minute)
+
+            day_slots.append((hour * 60 + minute, {
+                "time": time_str,
+                "show": show['show'],
+                "episode": ""
+            }))
+
+            # Add duration for next show's time
+            duration = estimate_show_duration(show['lower'])
+            current_minutes += duration
+
+    logger.debug(f"  {day_name}: {num_cells} cells -> {len(joined_shows)} shows")
+    return day_slots
+
+
+def parse_excel_schedule(excel_data: BinaryIO) -> dict:
     """Parse the Excel schedule into structured JSON format.
 
     Dynamically detects:
@@ -412,35 +886,32 @@ def parse_excel_schedule(excel_data: BytesIO) -> dict:
     - Themed programming (bold cells without dates)
     - Variable show durations (15, 30, or 60 minutes)
     """
-    # Load workbook twice: once for values, once for formatting (bold detection)
-    wb_values = load_workbook(excel_data, data_only=True)
-    ws_values = wb_values.active
-
-    excel_data.seek(0)  # Reset stream position
-    wb_format = load_workbook(excel_data, data_only=False)
-    ws_format = wb_format.active
-
-    # Step 1: Find the header row with day names
-    header_result = find_header_row(ws_values)
-    if not header_result:
+    try:
+        rows, bold_cells = read_xlsx_direct(excel_data)
+    except (KeyError, IndexError, ValueError, AttributeError, OverflowError,
+            zipfile.BadZipFile, ET.ParseError, CellCoordinatesException) as e:
+        logger.warning(f"Could not read xlsx directly ({e}), falling back to openpyxl")
+        excel_data.seek(0)
+        rows, bold_cells = read_xlsx_openpyxl(excel_data)
+
+    # Steps 1-3: Find the header row with day names, the ET (Eastern Time)
+    # column and the time blocks listed down it
+    layout = scan_worksheet(rows)
+    if not layout:
         logger.error("Could not find header row with day names")
         raise ValueError("Could not find header row with day names (MONDAY, TUESDAY, etc.)")
 
-    header_row, day_columns = header_result
+    header_row, day_columns, et_column, time_blocks = layout
     logger.info(f"Day columns detected: {day_columns}")
 
-    # Step 2: Find the ET (Eastern Time) column
-    et_column = find_et_column(ws_values, header_row)
-    if not et_column:
-        logger.warning("Could not find ET column, will try to infer time from block positions")
-
-    # Step 3: Detect time blocks from the ET column
+    # The date range sits in the title rows above the day names
+    week_start, week_end = extract_date_range(rows[:header_row])
     data_start_row = header_row + 1
-    time_blocks = []
 
     if et_column:
-        time_blocks = detect_time_blocks(ws_values, et_column, data_start_row)
         logger.info(f"Detected {len(time_blocks)} time blocks from ET column")
+    else:
+        logger.warning("Could not find ET column, will try to infer time from block positions")
 
     # Step 4: If we found time blocks, calculate rows per block
     if len(time_blocks) >= 2:
@@ -456,125 +927,26 @@ def parse_excel_schedule(excel_data: BytesIO) -> dict:
         rows_per_block = 5
         time_blocks = [(data_start_row + i * rows_per_block, i * 2) for i in range(12)]
 
-    # Step 5: Initialize day schedules
+    block_index = build_block_index(time_blocks, rows_per_block)
+
+    # Step 5: Initialize day schedules as (sort_minutes, slot) pairs
     day_schedules = {day: [] for day in day_columns.values()}
 
     # Step 6: Process each day column separately to handle continuations
     for col_idx, day_name in day_columns.items():
-        # Collect all cells for this day with their row numbers and values
-        day_cells = []
-
-        for block_idx, (block_start_row, base_hour) in enumerate(time_blocks):
-            for slot_idx in range(rows_per_block):
-                row_num = block_start_row + slot_idx
-
-                cell_value = ws_values.cell(row=row_num, column=col_idx).value
-                cell_format = ws_format.cell(row=row_num, column=col_idx)
-
-                # Check if cell is bold
-                cell_bold = False
-                if cell_format.font and cell_format.font.bold:
-                    cell_bold = True
-
-                if cell_value and str(cell_value).strip():
-                    val = str(cell_value).strip()
-                    if val.lower() not in ['none', 'n/a', '-', '']:
-                        day_cells.append({
-                            'row': row_num,
-                            'value': val,
-                            'bold': cell_bold,
-                            'block_idx': block_idx,
-                            'base_hour': base_hour
-                        })
-
-        # Step 7: Join continuations for this day
-        joined_shows = []
-        i = 0
-
-        while i < len(day_cells):
-            current = day_cells[i]
-            show_parts = [current['value']]
-            start_row = current['row']
-            start_block_idx = current['block_idx']
-            start_base_hour = current['base_hour']
-            is_bold = current['bold']
-
-            # Look ahead for continuations
-            j = i + 1
-            while j < len(day_cells):
-                next_cell = day_cells[j]
-                prev_text = show_parts[-1]
-
-                if is_continuation(next_cell['value'], prev_text, next_cell['row'],
-                                   day_cells[j-1]['row'], time_blocks, rows_per_block):
-                    show_parts.append(next_cell['value'])
-                    j += 1
-                else:
-                    break
-
-            # Build the joined show name
-            show_name = ' '.join(show_parts)
-
-            # Check if this is a theme header
-            if is_theme_header(show_name, is_bold):
-                show_name = f"[THEME] {show_name}"
-
-            joined_shows.append({
-                'show': show_name,
-                'block_idx': start_block_idx,
-                'base_hour': start_base_hour,
-                'start_row': start_row
-            })
-
-            i = j
-
-        # Step 8: Calculate times based on show durations within each block
-        # Group shows by block
-        blocks = {}
-        for show in joined_shows:
-            block_idx = show['block_idx']
-            if block_idx not in blocks:
-                blocks[block_idx] = []
-            blocks[block_idx].append(show)
-
-        # Process each block and assign times
-        for block_idx, block_shows in blocks.items():
-            if not block_shows:
-                continue
-
-            base_hour = block_shows[0]['base_hour']
-            current_minutes = base_hour * 60
-
-            for show in block_shows:
-                hour = (current_minutes // 60) % 24
-                minute = current_minutes % 60
-                time_str = format_time_et(hour, minute)
-
-                day_schedules[day_name].append({
-                    "time": time_str,
-                    "show": show['show'],
-                    "episode": ""
-                })
-
-                # Add duration for next show's time
-                duration = estimate_show_duration(show['show'])
-                current_minutes += duration
-
-        logger.debug(f"  {day_name}: {len(day_cells)} cells -> {len(joined_shows)} shows")
+        day_schedules[day_name].extend(parse_day_column(
+            rows, bold_cells, col_idx, day_name, time_blocks, rows_per_block, block_index))
 
-    # Step 9: Log results
+    # Step 7: Log results
     total_shows = sum(len(slots) for slots in day_schedules.values())
     logger.info(f"Parsed {total_shows} total shows across all days (after joining continuations)")
     for day_name, slots in day_schedules.items():
         logger.info(f"  {day_name}: {len(slots)} shows")
 
-    # Extract date range from the workbook
-    week_start, week_end = extract_date_range(ws_values)
-
     schedule_data = {
         "week_start": week_start,
         "week_end": week_end,
-        "last_updated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "last_updated": utc_timestamp(),
         "schedule": []
     }
 
@@ -585,82 +957,33 @@ def parse_excel_schedule(excel_data: BytesIO) -> dict:
             schedule_data["schedule"].append({
                 "day": day,
                 "date": "",  # Will be filled by frontend based on week_start
-                "slots": sorted(day_schedules[day],
-                              key=lambda x: parse_time_for_sort(x["time"]))
+                "slots": [slot for _, slot in
+                          sorted(day_schedules[day], key=itemgetter(0))]
             })
 
     return schedule_data
 
 
-def parse_time_for_sort(time_str: str) -> int:
-    """Convert time string to minutes for sorting."""
-    try:
-        time_str = time_str.upper().strip()
-
-        # Handle AM/PM
-        is_pm = 'PM' in time_str
-        time_str = time_str.replace('AM', '').replace('PM', '').strip()
-
-        parts = time_str.split(':')
-        hours = int(parts[0])
-        minutes = int(parts[1]) if len(parts) > 1 else 0
-
-        # Convert to 24-hour for sorting
-        if is_pm and hours != 12:
-            hours += 12
-        elif not is_pm and hours == 12:
-            hours = 0
-
-        return hours * 60 + minutes
-    except (ValueError, IndexError):
-        return 0
-
-
-def extract_date_range(ws) -> tuple[str, str]:
-    """Try to extract the date range from the worksheet.
+def extract_date_range(rows: list[tuple], max_rows: int = 10) -> tuple[str, str]:
+    """Try to extract the date range from the top rows of the worksheet.
 
     Handles formats like:
     - "Jan 19th - Jan 25th, 2026"
     - "January 19 - January 25, 2026"
     - "1/19/2026 - 1/25/2026"
     """
-    # Month name mapping
-    MONTHS = {
-        'jan': 1, 'january': 1,
-        'feb': 2, 'february': 2,
-        'mar': 3, 'march': 3,
-        'apr': 4, 'april': 4,
-        'may': 5,
-        'jun': 6, 'june': 6,
-        'jul': 7, 'july': 7,
-        'aug': 8, 'august': 8,
-        'sep': 9, 'sept': 9, 'september': 9,
-        'oct': 10, 'october': 10,
-        'nov': 11, 'november': 11,
-        'dec': 12, 'december': 12
-    }
-
-    # Pattern for "Jan 19th - Jan 25th, 2026" or "January 19 - January 25, 2026"
-    text_date_pattern = re.compile(
-        r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*[-–]\s*'
-        r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})',
-        re.IGNORECASE
-    )
-
-    # Pattern for numeric dates: "1/19/2026 - 1/25/2026"
-    numeric_date_pattern = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})')
-
-    for row in ws.iter_rows(min_row=1, max_row=10):
-        for cell in row:
-            if cell.value:
-                val = str(cell.value)
+    for row in rows[:max_rows]:
+        for cell_val in row[:MAX_HEADER_COLUMNS]:
+            # Title text is always a string; a date cell holds one date at most
+            if cell_val and isinstance(cell_val, str):
+                val = cell_val
 
                 # Try text date pattern first
-                text_match = text_date_pattern.search(val)
+                text_match = TEXT_DATE_PATTERN.search(val.lower())
                 if text_match:
-                    start_month_str = text_match.group(1).lower()
+                    start_month_str = text_match.group(1)
                     start_day = int(text_match.group(2))
-                    end_month_str = text_match.group(3).lower()
+                    end_month_str = text_match.group(3)
                     end_day = int(text_match.group(4))
                     year = int(text_match.group(5))
 
@@ -673,8 +996,8 @@ def extract_date_range(ws) -> tuple[str, str]:
                     logger.info(f"Extracted date range: {start_date} to {end_date}")
                     return start_date, end_date
 
-                # Try numeric date pattern
-                matches = numeric_date_pattern.findall(val)
+                # Try numeric date pattern: "1/19/2026 - 1/25/2026"
+                matches = NUMERIC_DATE_PATTERN.findall(val)
                 if len(matches) >= 2:
                     start = matches[0]
                     end = matches[1]
@@ -695,26 +1018,33 @@ def extract_date_range(ws) -> tuple[str, str]:
 
     # Default to current week (Monday-based since Excel uses Monday start)
     logger.warning("Could not extract date range from Excel, using current week")
-    today = datetime.now()
-    # Find most recent Monday
-    days_since_monday = today.weekday()
-    week_start = today - timedelta(days=days_since_monday)
+    return current_week_bounds(first_weekday=0)
+
+
+def current_week_bounds(first_weekday: int) -> tuple[str, str]:
+    """Return the current week's (start, end) dates as YYYY-MM-DD strings.
+
+    first_weekday uses date.weekday() numbering: 0 = Monday, 6 = Sunday.
+    """
+    today = date.today()
+    week_start = today - timedelta(days=(today.weekday() - first_weekday) % 7)
     week_end = week_start + timedelta(days=6)
+    return week_start.isoformat(), week_end.isoformat()
+
 
-    return week_start.strftime("%Y-%m-%d"), week_end.strftime("%Y-%m-%d")
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a 'Z' suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def create_default_schedule() -> dict:
-    """Create a default/placeholder schedule structure."""
-    today = datetime.now()
-    days_since_sunday = (today.weekday() + 1) % 7
-    week_start = today - timedelta(days=days_since_sunday)
-    week_end = week_start + timedelta(days=6)
+    """Create a default/placeholder schedule structure (Sunday-based week)."""
+    week_start, week_end = current_week_bounds(first_weekday=6)
 
     return {
-        "week_start": week_start.strftime("%Y-%m-%d"),
-        "week_end": week_end.strftime("%Y-%m-%d"),
-        "last_updated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "week_start": week_start,
+        "week_end": week_end,
+        "last_updated": utc_timestamp(),
         "schedule": [
             {"day": day, "date": "", "slots": []}
             for day in ['Sunday', 'Monday', 'Tuesday', 'Wednesday',
@@ -728,8 +1058,11 @@ def save_schedule(schedule: dict, output_path: Path) -> bool:
     """Save schedule to JSON file."""
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(schedule, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(schedule, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(schedule, f, indent=2, ensure_ascii=False)
         logger.info(f"Schedule saved to {output_path}")
         return True
     except IOError as e:
@@ -739,6 +1072,14 @@ def save_schedule(schedule: dict, output_path: Path) -> bool:
 
 def main() -> int:
     """Main entry point."""
+    try:
+        return run()
+    finally:
+        SESSION.close()
+
+
+def run() -> int:
+    """Fetch, parse, and save the schedule. Returns the process exit code."""
     logger.info("Starting Radio Classics schedule fetch")
 
     # Step 1: Fetch the source page
@@ -759,8 +1100,12 @@ def main() -> int:
         save_schedule(schedule, OUTPUT_PATH)
         return 1
 
-    # Step 3: Download the Excel file
-    excel_data = download_excel(excel_url)
+    # Step 3: Download the Excel file (conditionally, if schedule.json came from it)
+    saved_validators = load_excel_validators(excel_url, META_PATH, OUTPUT_PATH)
+    excel_data, validators = download_excel(excel_url, saved_validators)
+    if not excel_data and validators:
+        logger.info("Schedule file unchanged since last run, keeping existing schedule")
+        return 0
     if not excel_data:
         logger.error("Failed to download Excel file")
         schedule = create_default_schedule()
@@ -768,9 +1113,20 @@ def main() -> int:
         save_schedule(schedule, OUTPUT_PATH)
         return 1
 
+    # Same bytes as the workbook schedule.json was parsed from (e.g. the
+    # server sent no usable validators): keep it, just as on a 304
+    if saved_validators and saved_validators.get('sha256') == validators['sha256']:
+        excel_data.close()
+        logger.info("Schedule file content unchanged since last run, keeping existing schedule")
+        if validators != saved_validators:
+            # Fresh ETag / Last-Modified let the next run get a 304 instead
+            save_excel_validators(validators, META_PATH)
+        return 0
+
     # Step 4: Parse the schedule
     try:
-        schedule = parse_excel_schedule(excel_data)
+        with excel_data:
+            schedule = parse_excel_schedule(excel_data)
         logger.info(f"Parsed schedule for week {schedule['week_start']} to {schedule['week_end']}")
     except Exception as e:
         logger.error(f"Failed to parse Excel file: {e}")
@@ -782,6 +1138,7 @@ def main() -> int:
     # Step 5: Save the schedule
     if not save_schedule(schedule, OUTPUT_PATH):
         return 1
+    save_excel_validators(validators, META_PATH)
 
     logger.info("Schedule fetch completed successfully")
     return 0